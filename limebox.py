@@ -18,20 +18,331 @@ from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.layout import Layout
 from rich.live import Live
+from rich.segment import Segment
+from rich.style import Style
+from rich.cells import cell_len, set_cell_size
 from rich.text import Text
 import argparse
-from utils import ProjectDetector, ProjectRunner, clear_terminal
+from utils import (BuildCache, KeyReader, ProjectDetector, ProjectIndex, ProjectRunner, RUN_PROFILES,
+                   clear_terminal, run_load_test, wait_for_port)
 
 # Initialize console with lime theme
 console = Console()
 LIME_GREEN = "#00FF00"
 DARK_LIME = "#32CD32"
 
+BANNER = """██╗     ██╗███╗   ███╗███████╗██████╗  ██████╗ ██╗  ██╗
+██║     ██║████╗ ████║██╔════╝██╔══██╗██╔═══██╗╚██╗██╔╝
+██║     ██║██╔████╔██║█████╗  ██████╔╝██║   ██║ ╚███╔╝ 
+██║     ██║██║╚██╔╝██║██╔══╝  ██╔══██╗██║   ██║ ██╔██╗ 
+███████╗██║██║ ╚═╝ ██║███████╗██████╔╝╚██████╔╝██╔╝ ██╗
+╚══════╝╚═╝╚═╝     ╚═╝╚══════╝╚═════╝  ╚═════╝ ╚═╝  ╚═╝"""
+BANNER_HEIGHT = 10
+# Below this terminal height the banner shrinks to a one-line title
+FULL_BANNER_MIN_HEIGHT = 32
+
+class CachedRegion:
+    """Renders its content once per size, then replays the segments"""
+
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self.size = None
+        self.lines = None
+
+    def __rich_console__(self, console, options):
+        size = (options.max_width, options.height)
+        if size != self.size:
+            self.lines = console.render_lines(self.renderable, options, pad=True)
+            self.size = size
+        new_line = Segment.line()
+        for line in self.lines:
+            yield from line
+            yield new_line
+
+class ProjectPage:
+    """One page of the project list as fixed-width rows
+
+    Laid out directly as segments, which is far cheaper to redraw on every
+    keypress than a measured Rich Table.
+    """
+
+    # (heading, fixed width or None to share the remaining space, style)
+    COLUMNS = [
+        ("#", 6, "dim"),
+        ("Name", None, "white"),
+        ("Type", 12, "cyan"),
+        ("Source", 11, "yellow"),
+        ("Path", None, "dim")
+    ]
+    GAP = "  "
+
+    def __init__(self, rows, selected):
+        self.rows = rows
+        self.selected = selected
+
+    def _column_widths(self, width):
+        fixed = sum(w for _, w, _ in self.COLUMNS if w) + len(self.GAP) * (len(self.COLUMNS) - 1)
+        flexible = max(20, width - fixed)
+        # Name gets 2/5 of the spare width, path the rest
+        name_width = flexible * 2 // 5
+        return [w or name_width for _, w, _ in self.COLUMNS[:-1]] + [flexible - name_width]
+
+    def _fit(self, value, width, right=False, keep_end=False):
+        if cell_len(value) > width:
+            if keep_end:
+                # The end of a path names the project; drop the start instead
+                return "…" + set_cell_size(value[::-1], width - 1)[::-1]
+            return set_cell_size(value, width - 1) + "…"
+        if right:
+            return " " * (width - cell_len(value)) + value
+        return set_cell_size(value, width)
+
+    def __rich_console__(self, console, options):
+        widths = self._column_widths(options.max_width)
+        gap = Segment(self.GAP)
+        header_style = Style.parse(f"bold {LIME_GREEN}")
+        selected_style = Style.parse(f"bold black on {LIME_GREEN}")
+        styles = [Style.parse(style) for _, _, style in self.COLUMNS]
+
+        for i, (heading, _, _) in enumerate(self.COLUMNS):
+            if i:
+                yield gap
+            yield Segment(self._fit(heading, widths[i], right=(i == 0)), header_style)
+        yield Segment.line()
+        yield Segment("─" * options.max_width, Style(dim=True))
+        yield Segment.line()
+
+        for row_index, row in enumerate(self.rows):
+            selected = row_index == self.selected
+            for i, value in enumerate(row):
+                if i:
+                    yield Segment(self.GAP, selected_style) if selected else gap
+                yield Segment(self._fit(value, widths[i], right=(i == 0), keep_end=(i == len(row) - 1)),
+                              selected_style if selected else styles[i])
+            yield Segment.line()
+
+class Dashboard:
+    """Full-screen project browser with incremental search, drawn with Rich Live
+
+    Each region of the screen is rebuilt only when the state it shows has
+    changed and otherwise replays its last rendered lines, and the screen
+    is refreshed only after a keypress changes something.
+    """
+
+    HOTKEYS = {
+        '1': 'add',
+        '2': 'clone',
+        '3': 'run',
+        '5': 'remove',
+        '6': 'settings',
+        '0': 'exit',
+        'q': 'exit'
+    }
+
+    def __init__(self, app):
+        self.app = app
+        self.query = ""
+        self.searching = False
+        self.matches = []
+        self.generation = 0
+        self.cursor = 0
+        self.search_ms = 0.0
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(name="header", size=BANNER_HEIGHT),
+            Layout(name="search", size=3),
+            Layout(name="projects"),
+            Layout(name="footer", size=3)
+        )
+        self.layout["footer"].update(CachedRegion(self.footer_panel()))
+        self.drawn = {}
+        self.set_query("")
+
+    def set_query(self, query):
+        """Search the project index and move to the top of the results"""
+        start = time.perf_counter()
+        self.query = query
+        self.matches = self.app.index.search(query)
+        self.generation += 1
+        self.search_ms = (time.perf_counter() - start) * 1000
+        self.cursor = 0
+
+    def refresh_matches(self):
+        """Re-run the search after projects were added or removed"""
+        cursor = self.cursor
+        self.set_query(self.query)
+        self.cursor = min(cursor, max(len(self.matches) - 1, 0))
+
+    def selected(self):
+        return self.matches[self.cursor] if self.matches else None
+
+    def page_size(self):
+        """Project rows that fit between the header, search bar and footer"""
+        header = self.layout["header"].size
+        return max(3, console.size.height - header - 3 - 3 - 2)
+
+    def move(self, delta):
+        if self.matches:
+            self.cursor = max(0, min(len(self.matches) - 1, self.cursor + delta))
+
+    def header_panel(self, full):
+        if full:
+            return Panel(
+                Text(BANNER, style=f"bold {LIME_GREEN}", no_wrap=True, overflow="crop"),
+                title=f"[bold {LIME_GREEN}]Terminal Project Runner[/bold {LIME_GREEN}]",
+                subtitle="[dim]v1.0.0 - Run any project, anywhere[/dim]",
+                border_style=LIME_GREEN,
+                padding=(1, 2)
+            )
+        return Panel(
+            Text("🟢 LimeBox - Terminal Project Runner", style=f"bold {LIME_GREEN}"),
+            border_style=LIME_GREEN
+        )
+
+    def search_panel(self):
+        grid = Table.grid(expand=True)
+        grid.add_column()
+        grid.add_column(justify="right", style="dim")
+        if self.query or self.searching:
+            prompt = Text(f"🔍 {self.query}", style="bold white")
+            if self.searching:
+                prompt.append("▏", style=LIME_GREEN)
+        else:
+            prompt = Text("🔍 Press / to search", style="dim")
+        grid.add_row(
+            prompt,
+            f"{len(self.matches)} of {len(self.app.index)} projects · {self.search_ms:.1f} ms"
+        )
+        return Panel(grid, border_style=LIME_GREEN if self.searching else "dim")
+
+    def projects_table(self, start, rows):
+        if not self.matches:
+            message = "No projects added yet. Press 1 or 2 to add one." if not self.app.projects \
+                else "No projects match your search."
+            return Panel(Text(message, style="yellow"), border_style="dim")
+
+        page = []
+        for i, name in enumerate(self.matches[start:start + rows], start):
+            info = self.app.projects[name]
+            source_icon = "🌐" if info['source'] == 'github' else "📁"
+            page.append((str(i + 1), name, info['type'], f"{source_icon} {info['source']}", info['path']))
+        return ProjectPage(page, self.cursor - start)
+
+    def footer_panel(self):
+        keys = [
+            ("↑↓", "Move"), ("PgUp/PgDn", "Page"), ("/", "Search"), ("Esc", "Done"), ("Enter/3", "Run"),
+            ("1", "Add"), ("2", "Clone"), ("4", "All"), ("5", "Remove"), ("6", "Settings"), ("0", "Exit")
+        ]
+        text = Text(no_wrap=True, overflow="ellipsis")
+        for key, desc in keys:
+            text.append(f" {key} ", style=f"bold {LIME_GREEN}")
+            text.append(f"{desc} ", style="white")
+        return Panel(text, border_style="dim")
+
+    def _update(self, region, state, build):
+        """Rebuild a region only when the state it shows has changed"""
+        if self.drawn.get(region) == state:
+            return False
+        self.layout[region].update(CachedRegion(build()))
+        self.drawn[region] = state
+        return True
+
+    def draw(self, live):
+        full = console.size.height >= FULL_BANNER_MIN_HEIGHT
+        self.layout["header"].size = BANNER_HEIGHT if full else 3
+        rows = self.page_size()
+        start = self.cursor - self.cursor % rows
+
+        changed = self._update("header", full, lambda: self.header_panel(full))
+        changed |= self._update(
+            "search",
+            (self.query, self.searching, len(self.matches), len(self.app.index), round(self.search_ms, 1)),
+            self.search_panel
+        )
+        changed |= self._update(
+            "projects",
+            (self.generation, start, rows, self.cursor, console.size.width),
+            lambda: self.projects_table(start, rows)
+        )
+        if changed:
+            live.refresh()
+
+    def handle_key(self, key):
+        """Apply a keypress; return an action name when the dashboard should hand over"""
+        rows = self.page_size()
+        if key == 'up':
+            self.move(-1)
+        elif key == 'down':
+            self.move(1)
+        elif key in ('pgup', 'left'):
+            self.move(-rows)
+        elif key in ('pgdn', 'right'):
+            self.move(rows)
+        elif key == 'home':
+            self.move(-len(self.matches))
+        elif key == 'end':
+            self.move(len(self.matches))
+        elif key == 'enter':
+            return 'run'
+        elif self.searching:
+            if key == 'esc':
+                self.searching = False
+            elif key == 'backspace':
+                self.set_query(self.query[:-1])
+            elif key.isprintable() and key:
+                self.set_query(self.query + key)
+        elif key == '/':
+            self.searching = True
+        elif key in ('4', 'esc'):
+            self.set_query("")
+        elif key in self.HOTKEYS:
+            return self.HOTKEYS[key]
+        return None
+
+    def select(self):
+        """Show the dashboard until the user picks an action; return (action, project name)"""
+        self.drawn = {}
+        with KeyReader() as keys, Live(self.layout, console=console, screen=True, auto_refresh=False) as live:
+            self.draw(live)
+            while True:
+                action = self.handle_key(keys.read_key())
+                if action:
+                    return action, self.selected()
+                self.draw(live)
+
 class LimeBox:
-    def __init__(self):
+    def __init__(self, profile=None, workers=None, threads=None, max_requests=None, use_build_cache=True):
         self.config_file = "config.json"
         self.projects = {}
+        self.settings = {}
+        # Command-line overrides win over per-project run settings
+        self.profile = profile
+        self.worker_overrides = {
+            'workers': workers,
+            'threads': threads,
+            'max_requests': max_requests
+        }
         self.load_config()
+        self.index = ProjectIndex(self.projects)
+
+        self.build_cache = None
+        if use_build_cache and self.settings.get('build_cache', True):
+            max_mb = self.settings.get('build_cache_max_mb', 2048)
+            self.build_cache = BuildCache(max_size=max_mb * 1024 * 1024)
+
+    def make_runner(self, project_info, profile=None):
+        """Build a ProjectRunner for a project with its run settings applied"""
+        settings = {
+            key: value if value is not None else project_info.get(key)
+            for key, value in self.worker_overrides.items()
+        }
+        return ProjectRunner(
+            project_info['path'],
+            project_info['type'],
+            profile=profile or self.profile or project_info.get('profile', 'dev'),
+            build_cache=self.build_cache,
+            **settings
+        )
 
     def load_config(self):
         """Load configuration from config.json"""
@@ -40,6 +351,7 @@ class LimeBox:
                 with open(self.config_file, 'r') as f:
                     data = json.load(f)
                     self.projects = data.get('projects', {})
+                    self.settings = data.get('settings', {})
             else:
                 self.save_config()
         except Exception as e:
@@ -50,6 +362,7 @@ class LimeBox:
         try:
             data = {
                 'projects': self.projects,
+                'settings': self.settings,
                 'last_updated': datetime.now().isoformat()
             }
             with open(self.config_file, 'w') as f:
@@ -57,53 +370,6 @@ class LimeBox:
         except Exception as e:
             console.print(f"[red]Error saving config: {e}[/red]")
 
-    def show_banner(self):
-        """Display the LimeBox ASCII banner"""
-        clear_terminal()
-
-        banner = """
-██╗     ██╗███╗   ███╗███████╗██████╗  ██████╗ ██╗  ██╗
-██║     ██║████╗ ████║██╔════╝██╔══██╗██╔═══██╗╚██╗██╔╝
-██║     ██║██╔████╔██║█████╗  ██████╔╝██║   ██║ ╚███╔╝ 
-██║     ██║██║╚██╔╝██║██╔══╝  ██╔══██╗██║   ██║ ██╔██╗ 
-███████╗██║██║ ╚═╝ ██║███████╗██████╔╝╚██████╔╝██╔╝ ██╗
-╚══════╝╚═╝╚═╝     ╚═╝╚══════╝╚═════╝  ╚═════╝ ╚═╝  ╚═╝
-        """
-
-        console.print(Panel(
-            Text(banner, style=f"bold {LIME_GREEN}"),
-            title=f"[bold {LIME_GREEN}]Terminal Project Runner[/bold {LIME_GREEN}]",
-            subtitle="[dim]v1.0.0 - Run any project, anywhere[/dim]",
-            border_style=LIME_GREEN,
-            padding=(1, 2)
-        ))
-
-    def show_menu(self):
-        """Display the main menu"""
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Option", style=f"bold {LIME_GREEN}", width=4)
-        table.add_column("Description", style="white")
-
-        options = [
-            ("1", "📁 Add Local Project"),
-            ("2", "🌐 Clone from GitHub"),
-            ("3", "🚀 Run Project"),
-            ("4", "📋 List Projects"),
-            ("5", "🗑️  Remove Project"),
-            ("6", "⚙️  Settings"),
-            ("0", "🚪 Exit")
-        ]
-
-        for option, desc in options:
-            table.add_row(option, desc)
-
-        console.print("\n")
-        console.print(Panel(
-            table,
-            title=f"[bold {LIME_GREEN}]Main Menu[/bold {LIME_GREEN}]",
-            border_style=LIME_GREEN
-        ))
-
     def add_local_project(self):
         """Add a local project to LimeBox"""
         console.print(f"\n[bold {LIME_GREEN}]Add Local Project[/bold {LIME_GREEN}]")
@@ -129,6 +395,7 @@ class LimeBox:
             'source': 'local',
             'added': datetime.now().isoformat()
         }
+        self.index.add(name, self.projects[name])
 
         self.save_config()
         console.print(f"[{LIME_GREEN}]✅ Added project '{name}' successfully![/{LIME_GREEN}]")
@@ -174,6 +441,7 @@ class LimeBox:
                     'repo_url': repo_url,
                     'added': datetime.now().isoformat()
                 }
+                self.index.add(name, self.projects[name])
 
                 self.save_config()
                 console.print(f"[{LIME_GREEN}]✅ Cloned and added '{name}' ({project_type})[/{LIME_GREEN}]")
@@ -185,58 +453,33 @@ class LimeBox:
 
         input("\nPress Enter to continue...")
 
-    def list_projects(self):
-        """Display all projects"""
-        console.print(f"\n[bold {LIME_GREEN}]Your Projects[/bold {LIME_GREEN}]")
-
-        if not self.projects:
-            console.print("[yellow]No projects added yet.[/yellow]")
-            input("\nPress Enter to continue...")
-            return
-
-        table = Table(show_header=True, header_style=f"bold {LIME_GREEN}")
-        table.add_column("Name", style="white", width=20)
-        table.add_column("Type", style="cyan", width=15)
-        table.add_column("Source", style="yellow", width=10)
-        table.add_column("Path", style="dim", no_wrap=False)
-
-        for name, info in self.projects.items():
-            source_icon = "🌐" if info['source'] == 'github' else "📁"
-            table.add_row(
-                name,
-                info['type'],
-                f"{source_icon} {info['source']}",
-                info['path']
-            )
-
-        console.print(table)
-        input("\nPress Enter to continue...")
-
-    def run_project(self):
-        """Run a selected project"""
-        if not self.projects:
+    def run_project(self, project_name):
+        """Run the project selected on the dashboard"""
+        if project_name not in self.projects:
             console.print("[yellow]No projects available. Add some first![/yellow]")
             input("\nPress Enter to continue...")
             return
 
-        console.print(f"\n[bold {LIME_GREEN}]Run Project[/bold {LIME_GREEN}]")
-
-        # Show projects list
-        projects_list = list(self.projects.keys())
-        for i, name in enumerate(projects_list, 1):
-            info = self.projects[name]
-            console.print(f"[{LIME_GREEN}]{i}[/{LIME_GREEN}]. {name} ([cyan]{info['type']}[/cyan])")
+        console.print(f"\n[bold {LIME_GREEN}]Run Project: {project_name}[/bold {LIME_GREEN}]")
+        project_info = self.projects[project_name]
 
         try:
-            choice = int(Prompt.ask("Select project", choices=[str(i) for i in range(1, len(projects_list) + 1)]))
-            project_name = projects_list[choice - 1]
-            project_info = self.projects[project_name]
+            # Ask for run profile, remembering the choice per project
+            # A --profile override applies to this session only
+            profile = self.profile
+            if not profile:
+                profile = Prompt.ask(
+                    "Run profile", choices=RUN_PROFILES, default=project_info.get('profile', 'dev')
+                )
+                if project_info.get('profile', 'dev') != profile:
+                    project_info['profile'] = profile
+                    self.save_config()
 
             # Ask for run mode
             expose = Confirm.ask("Expose online? (No = localhost only)", default=False)
 
             # Run the project
-            runner = ProjectRunner(project_info['path'], project_info['type'])
+            runner = self.make_runner(project_info, profile)
             runner.run(expose=expose, project_name=project_name)
 
         except (ValueError, KeyboardInterrupt):
@@ -244,29 +487,23 @@ class LimeBox:
 
         input("\nPress Enter to continue...")
 
-    def remove_project(self):
-        """Remove a project from LimeBox"""
-        if not self.projects:
+    def remove_project(self, project_name):
+        """Remove the project selected on the dashboard"""
+        if project_name not in self.projects:
             console.print("[yellow]No projects to remove.[/yellow]")
             input("\nPress Enter to continue...")
             return
 
         console.print(f"\n[bold {LIME_GREEN}]Remove Project[/bold {LIME_GREEN}]")
 
-        projects_list = list(self.projects.keys())
-        for i, name in enumerate(projects_list, 1):
-            console.print(f"[{LIME_GREEN}]{i}[/{LIME_GREEN}]. {name}")
-
         try:
-            choice = int(Prompt.ask("Select project to remove", choices=[str(i) for i in range(1, len(projects_list) + 1)]))
-            project_name = projects_list[choice - 1]
-
             if Confirm.ask(f"Remove '{project_name}'?", default=False):
                 del self.projects[project_name]
+                self.index.remove(project_name)
                 self.save_config()
                 console.print(f"[{LIME_GREEN}]✅ Removed '{project_name}'[/{LIME_GREEN}]")
 
-        except (ValueError, KeyboardInterrupt):
+        except KeyboardInterrupt:
             console.print("[yellow]Cancelled.[/yellow]")
 
         input("\nPress Enter to continue...")
@@ -283,35 +520,111 @@ class LimeBox:
         settings_table.add_row("Total Projects", str(len(self.projects)))
         settings_table.add_row("Working Directory", os.getcwd())
 
+        if self.build_cache:
+            stats = self.build_cache.get_stats()
+            settings_table.add_row("Build Cache", str(self.build_cache.root))
+            settings_table.add_row(
+                "Cache Usage",
+                f"{stats['size'] / 1024 ** 2:.1f} / {stats['max_size'] / 1024 ** 2:.0f} MB "
+                f"({stats['entries']} builds)"
+            )
+            settings_table.add_row(
+                "Cache Hits",
+                f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%}), "
+                f"{stats['evictions']} evicted"
+            )
+        else:
+            settings_table.add_row("Build Cache", "disabled")
+
         console.print(Panel(settings_table, title=f"[bold {LIME_GREEN}]Current Settings[/bold {LIME_GREEN}]", border_style=LIME_GREEN))
         input("\nPress Enter to continue...")
 
+    def benchmark_project(self, project_name, url_path="/", total_requests=500, concurrency=10):
+        """Load test a project under the dev and prod profiles and compare them"""
+        if project_name not in self.projects:
+            console.print(f"[red]❌ Unknown project '{project_name}'[/red]")
+            return None
+
+        project_info = self.projects[project_name]
+        results = {}
+
+        for profile in RUN_PROFILES:
+            runner = self.make_runner(project_info, profile)
+            port = runner.get_port()
+            if port is None:
+                console.print(f"[red]❌ {project_info['type']} projects don't serve HTTP[/red]")
+                return None
+
+            console.print(f"\n[bold {LIME_GREEN}]Benchmarking {project_name} ({profile})[/bold {LIME_GREEN}]")
+            try:
+                runner.install_dependencies()
+                runner.build()
+                console.print(f"[dim]Command: {' '.join(runner.get_run_command())}[/dim]")
+                process = runner.start()
+            except Exception:
+                console.print(f"[red]❌ Could not start the {profile} profile[/red]")
+                continue
+
+            try:
+                if not wait_for_port(port, process=process):
+                    console.print(f"[red]❌ {project_name} never listened on port {port}[/red]")
+                    continue
+                url = f"http://127.0.0.1:{port}{url_path}"
+                # Warm up lazy imports and caches before measuring
+                run_load_test(url, total_requests=min(20, total_requests), concurrency=1)
+                results[profile] = run_load_test(url, total_requests, concurrency)
+            finally:
+                runner.stop()
+
+        table = Table(show_header=True, header_style=f"bold {LIME_GREEN}",
+                      title=f"{project_name}: {total_requests} requests, concurrency {concurrency}")
+        table.add_column("Profile", style="white")
+        table.add_column("Req/s", style=LIME_GREEN, justify="right")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p95 ms", justify="right")
+        table.add_column("p99 ms", justify="right")
+        table.add_column("Errors", style="red", justify="right")
+
+        for profile, stats in results.items():
+            table.add_row(
+                profile,
+                f"{stats['rps']:.1f}",
+                f"{stats['p50_ms']:.1f}",
+                f"{stats['p95_ms']:.1f}",
+                f"{stats['p99_ms']:.1f}",
+                str(stats['errors'])
+            )
+
+        console.print(table)
+        if "dev" in results and "prod" in results and results["dev"]['rps']:
+            speedup = results["prod"]['rps'] / results["dev"]['rps']
+            console.print(f"[{LIME_GREEN}]prod vs dev throughput: {speedup:.2f}x[/{LIME_GREEN}]")
+        return results
+
     def run(self):
         """Main application loop"""
+        dashboard = Dashboard(self)
         while True:
-            self.show_banner()
-            self.show_menu()
-
             try:
-                choice = Prompt.ask(f"\n[bold {LIME_GREEN}]Select option[/bold {LIME_GREEN}]", 
-                                  choices=["0", "1", "2", "3", "4", "5", "6"])
+                action, project_name = dashboard.select()
 
-                if choice == "0":
+                if action == "exit":
                     clear_terminal()
                     console.print(f"[{LIME_GREEN}]Thanks for using LimeBox! 🚀[/{LIME_GREEN}]")
                     break
-                elif choice == "1":
+
+                clear_terminal()
+                if action == "add":
                     self.add_local_project()
-                elif choice == "2":
+                elif action == "clone":
                     self.clone_github_project()
-                elif choice == "3":
-                    self.run_project()
-                elif choice == "4":
-                    self.list_projects()
-                elif choice == "5":
-                    self.remove_project()
-                elif choice == "6":
+                elif action == "run":
+                    self.run_project(project_name)
+                elif action == "remove":
+                    self.remove_project(project_name)
+                elif action == "settings":
                     self.show_settings()
+                dashboard.refresh_matches()
 
             except KeyboardInterrupt:
                 clear_terminal()
@@ -321,19 +634,52 @@ class LimeBox:
                 console.print(f"[red]Error: {e}[/red]")
                 input("Press Enter to continue...")
 
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="LimeBox - Terminal Project Runner")
-    parser.add_argument('action', nargs='?', choices=['start', 'run'], default='start',
-                       help='Action to perform (start or run)')
+    parser.add_argument('action', nargs='?', choices=['start', 'run', 'bench'], default='start',
+                       help='Action to perform (start, run or bench)')
+    parser.add_argument('--profile', choices=RUN_PROFILES,
+                       help='Run profile for every project (default: per-project setting)')
+    parser.add_argument('--workers', type=positive_int,
+                       help='Production worker processes (default: sized from CPU count)')
+    parser.add_argument('--threads', type=positive_int,
+                       help='Threads per production worker for Flask/Django (default: 2)')
+    parser.add_argument('--max-requests', type=positive_int,
+                       help='Recycle production workers after this many requests')
+    parser.add_argument('--no-build-cache', action='store_true',
+                       help='Always rebuild JS projects instead of restoring cached builds')
+    parser.add_argument('--project', help='Project to benchmark (bench only)')
+    parser.add_argument('--url-path', default='/', help='Path to request when benchmarking')
+    parser.add_argument('--requests', type=positive_int, default=500, help='Requests per profile when benchmarking')
+    parser.add_argument('--concurrency', type=positive_int, default=10, help='Concurrent clients when benchmarking')
 
     args = parser.parse_args()
 
+    app = LimeBox(profile=args.profile, workers=args.workers,
+                  threads=args.threads, max_requests=args.max_requests,
+                  use_build_cache=not args.no_build_cache)
+
+    if args.action == 'bench':
+        if not args.project:
+            parser.error("bench requires --project")
+        results = app.benchmark_project(args.project, args.url_path, args.requests, args.concurrency)
+        sys.exit(0 if results else 1)
+
     # Check if running in terminal
     if not sys.stdout.isatty():
         print("LimeBox requires a terminal environment!")
         sys.exit(1)
 
-    app = LimeBox()
     app.run()
 
 if __name__ == "__main__":
@@ -5,12 +5,34 @@ Helper functions for project detection, dependency installation, and running
 """
 
 import os
+import re
 import json
+import codecs
+import shutil
+import hashlib
 import subprocess
 import threading
 import time
 import sys
+import signal
+import socket
+import statistics
+import tempfile
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, compress, islice, repeat
+from operator import add
 from pathlib import Path
+
+try:
+    import fcntl
+    import select
+    import termios
+    import tty
+except ImportError:
+    # Windows reads keys through msvcrt instead
+    import msvcrt
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.panel import Panel
@@ -20,9 +42,285 @@ from rich.live import Live
 console = Console()
 LIME_GREEN = "#00FF00"
 
+RUN_PROFILES = ["dev", "prod"]
+JS_BUILD_FRAMEWORKS = ["Next.js", "React", "Vue.js", "Angular", "Svelte"]
+
+# Directories each framework's production build may write to; only the
+# ones a build actually changes are cached
+BUILD_OUTPUTS = {
+    "Next.js": [".next"],
+    "React": ["build", "dist"],
+    "Vue.js": ["dist"],
+    "Angular": ["dist"],
+    "Svelte": ["build", "dist"]
+}
+# Build tool caches that are kept in place rather than stored
+BUILD_OUTPUT_KEEP = [os.path.join(".next", "cache")]
+LOCKFILES = ["package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb"]
+# Left out of cache keys at any depth
+CACHE_IGNORED_DIRS = {"node_modules", ".git"}
+# Each framework's own tool caches; these and its BUILD_OUTPUTS are left out
+# of its cache keys, but only at the project root
+BUILD_TOOL_CACHES = {
+    "Next.js": [".next"],
+    "Angular": [".angular"],
+    "Svelte": [".svelte-kit"]
+}
+# Unreferenced objects younger than this may belong to a store() that has
+# not written its manifest yet, so eviction leaves them alone
+ORPHAN_GRACE_SECONDS = 600
+# Linux ioctl that clones a file's extents (a reflink) on btrfs, XFS and similar
+FICLONE = 0x40049409
+
+def get_cpu_count():
+    """Number of CPUs this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
 def clear_terminal():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    console.clear()
+
+class KeyReader:
+    """Read single keypresses from the terminal without waiting for Enter"""
+
+    ESCAPE_SEQUENCES = {
+        '[A': 'up', '[B': 'down', '[C': 'right', '[D': 'left',
+        'OA': 'up', 'OB': 'down', 'OC': 'right', 'OD': 'left',
+        '[H': 'home', '[F': 'end', 'OH': 'home', 'OF': 'end',
+        '[1~': 'home', '[4~': 'end', '[5~': 'pgup', '[6~': 'pgdn', '[3~': 'delete'
+    }
+    WINDOWS_KEYS = {
+        'H': 'up', 'P': 'down', 'M': 'right', 'K': 'left',
+        'G': 'home', 'O': 'end', 'I': 'pgup', 'Q': 'pgdn', 'S': 'delete'
+    }
+
+    def __init__(self):
+        self.fd = None
+        self.saved = None
+        # Characters decoded but not yet returned; multi-byte UTF-8 is
+        # assembled by the decoder across single-byte reads
+        self.pending = ""
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def __enter__(self):
+        if os.name != 'nt':
+            self.fd = sys.stdin.fileno()
+            self.saved = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self.saved is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.saved)
+            self.saved = None
+
+    def _read_char(self, timeout=None):
+        """Next character from the terminal, or '' if none arrives within timeout"""
+        while not self.pending:
+            if timeout is not None and not select.select([self.fd], [], [], timeout)[0]:
+                return ''
+            self.pending += self.decoder.decode(os.read(self.fd, 1))
+        ch, self.pending = self.pending[0], self.pending[1:]
+        return ch
+
+    def _read_escape(self):
+        """Parse one escape sequence after ESC; anything else is left for the next key"""
+        # The rest of a sequence arrives right behind the ESC; a lone ESC doesn't
+        intro = self._read_char(timeout=0.02)
+        if intro not in ('[', 'O'):
+            self.pending = intro + self.pending
+            return 'esc'
+        seq = intro
+        while True:
+            ch = self._read_char(timeout=0.02)
+            if not ch:
+                break
+            seq += ch
+            # SS3 sequences are one character; CSI ends at a byte in @..~
+            if intro == 'O' or '@' <= ch <= '~':
+                break
+        return self.ESCAPE_SEQUENCES.get(seq, '')
+
+    def read_key(self):
+        """Block for one keypress and return its name or character"""
+        if os.name == 'nt':
+            ch = msvcrt.getwch()
+            if ch in ('\x00', '\xe0'):
+                return self.WINDOWS_KEYS.get(msvcrt.getwch(), '')
+        else:
+            ch = self._read_char()
+            if ch == '\x1b':
+                return self._read_escape()
+
+        if ch in ('\r', '\n'):
+            return 'enter'
+        if ch in ('\x7f', '\x08'):
+            return 'backspace'
+        if ch == '\x1b':
+            return 'esc'
+        if ch == '\x03':
+            raise KeyboardInterrupt
+        return ch
+
+class SearchResults:
+    """Project names matching a search, ordered only as far as they are read
+
+    Matches are grouped by score, and each group is already in alphabetical
+    order. Reading the first page pulls just enough names from the best
+    groups, so a query matching thousands of projects never sorts them all.
+    """
+
+    def __init__(self, names, positions, scores):
+        self.names = names
+        self.positions = positions
+        self._order = []
+        buckets = sorted(set(scores), reverse=True)
+        self._pending = chain.from_iterable(
+            compress(positions, map(score.__eq__, scores)) for score in buckets
+        )
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _ensure(self, count):
+        if count > len(self._order):
+            self._order.extend(islice(self._pending, count - len(self._order)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            self._ensure(stop)
+            return [self.names[i] for i in self._order[start:stop:step]]
+        if index < 0:
+            index += len(self)
+        self._ensure(index + 1)
+        return self.names[self._order[index]]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class ProjectIndex:
+    """Incremental fuzzy search over project names, types and paths
+
+    Each project's lowercased name and "name type path" text are prepared
+    once, in alphabetical order, so a query is a few C-level scans over
+    those lists. Only the last two parts of a path are searched, since the
+    leading directories are usually shared by every project. A query that
+    extends an earlier one only rescans that query's matches, and recent
+    results are memoized for backspacing.
+    """
+
+    # Recent results kept for narrowing and instant backspacing
+    MEMO_SIZE = 64
+
+    def __init__(self, projects=None):
+        self.entries = {}
+        self._names = None
+        self._name_texts = []
+        self._haystacks = []
+        self._memo = {}
+        for name, info in (projects or {}).items():
+            self.add(name, info)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, name, info):
+        """Index a project, replacing any entry with the same name"""
+        text = name.lower()
+        path_tail = '/'.join(info.get('path', '').replace('\\', '/').rstrip('/').split('/')[-2:])
+        self.entries[name] = (text, f"{text} {info.get('type', '')} {path_tail}".lower())
+        self._names = None
+
+    def remove(self, name):
+        """Drop a project from the index"""
+        if self.entries.pop(name, None) is not None:
+            self._names = None
+
+    def all_names(self):
+        """Every project name in alphabetical order"""
+        self._build()
+        return self._names
+
+    def _build(self):
+        """Rebuild the sorted lists after projects were added or removed"""
+        if self._names is not None:
+            return
+        self._names = sorted(self.entries, key=str.lower)
+        self._name_texts = [self.entries[name][0] for name in self._names]
+        self._haystacks = [self.entries[name][1] for name in self._names]
+        self._memo = {}
+
+    def _narrowest_candidates(self, tokens):
+        """Positions to scan and the words they still have to be filtered by
+
+        An earlier query whose words are a prefix of these words already
+        matched every word but its last, so only the rest need scanning.
+        """
+        key = ' '.join(tokens)
+        best = None
+        for previous in self._memo:
+            if key.startswith(previous) and (best is None or len(previous) > len(best)):
+                best = previous
+        if best is None:
+            return range(len(self._names)), tokens
+        matched = best.split()
+        done = len(matched) if tokens[len(matched) - 1] == matched[-1] else len(matched) - 1
+        return self._memo[best].positions, tokens[done:]
+
+    def _select(self, values, positions):
+        """values at positions, without copying when every project is included"""
+        if len(positions) == len(values):
+            return values
+        return [values[i] for i in positions]
+
+    def _fuzzy_filter(self, positions, token):
+        """Positions whose text contains token's characters in order"""
+        texts = self._select(self._haystacks, positions)
+        if len(token) == 1:
+            return list(compress(positions, map(str.__contains__, texts, repeat(token))))
+        # [^c]*c can only match one way, so this never backtracks
+        test = re.compile(''.join(f"[^{re.escape(ch)}]*{re.escape(ch)}" for ch in token)).match
+        return list(compress(positions, map(test, texts)))
+
+    def _rank(self, names, texts, token):
+        """Score one word: 3 name prefix, 2 in name, 1 in type/path, 0 fuzzy only"""
+        prefix = map(str.startswith, names, repeat(token))
+        in_name = map(str.__contains__, names, repeat(token))
+        if len(token) == 1:
+            # A single character is always in the text, so it can't reorder anything
+            return map(add, prefix, in_name)
+        in_text = map(str.__contains__, texts, repeat(token))
+        return map(add, map(add, prefix, in_name), in_text)
+
+    def search(self, query):
+        """Names of projects matching every word of query, best first"""
+        self._build()
+        tokens = query.lower().split()
+        if not tokens:
+            return self._names
+
+        key = ' '.join(tokens)
+        if key not in self._memo:
+            # Positions stay ascending, which is alphabetical order
+            positions, pending = self._narrowest_candidates(tokens)
+            for token in pending:
+                positions = self._fuzzy_filter(positions, token)
+            if isinstance(positions, range):
+                positions = list(positions)
+
+            names = self._select(self._name_texts, positions)
+            texts = self._select(self._haystacks, positions)
+            scores = list(self._rank(names, texts, tokens[0]))
+            for token in tokens[1:]:
+                scores = list(map(add, scores, self._rank(names, texts, token)))
+            if len(self._memo) >= self.MEMO_SIZE:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[key] = SearchResults(self._names, positions, scores)
+
+        return self._memo[key]
 
 class ProjectDetector:
     """Detect project type and framework"""
@@ -195,12 +493,308 @@ class ProjectDetector:
         files = ['index.html', 'index.htm']
         return any((self.path / f).exists() for f in files)
 
+class BuildCache:
+    """Content-addressed store of JS production build outputs
+
+    Entries are keyed by a hash of the project's source files, lockfile and
+    Node.js version, never its path, so clones of the same repo share them.
+    File contents live once under objects/ and are reflinked or copied back
+    into the project on a hit, so project files never share storage with
+    the store.
+    """
+
+    def __init__(self, cache_dir=None, max_size=2 * 1024 ** 3):
+        self.root = Path(cache_dir or os.environ.get('LIMEBOX_CACHE_DIR')
+                         or Path.home() / ".limebox" / "build-cache")
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+        self.stats_file = self.root / "stats.json"
+        self.max_size = max_size
+        self._toolchain = None
+
+    def get_toolchain_version(self):
+        """Node.js version used to build, part of every cache key"""
+        if self._toolchain is None:
+            try:
+                result = subprocess.run(["node", "--version"], capture_output=True, text=True)
+                self._toolchain = result.stdout.strip() or "unknown"
+            except FileNotFoundError:
+                self._toolchain = "unknown"
+        return self._toolchain
+
+    def _iter_source_files(self, project_path, project_type):
+        """Yield source files relative to the project, in a stable order"""
+        root_ignored = set(BUILD_OUTPUTS.get(project_type, [])) | set(BUILD_TOOL_CACHES.get(project_type, []))
+        for root, dirs, files in os.walk(project_path):
+            at_root = os.path.samefile(root, project_path)
+            dirs[:] = sorted(
+                d for d in dirs
+                if d not in CACHE_IGNORED_DIRS and not (at_root and d in root_ignored)
+            )
+            for name in sorted(files):
+                full = os.path.join(root, name)
+                if os.path.isfile(full):
+                    yield os.path.relpath(full, project_path)
+
+    def _hash_file(self, path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def compute_key(self, project_path, project_type, build_cmd):
+        """Hash everything that can change the build output"""
+        project_path = Path(project_path)
+        key = hashlib.sha256()
+        key.update(json.dumps([project_type, build_cmd, self.get_toolchain_version()]).encode())
+
+        # Lockfiles first so dependency bumps always change the key
+        for lockfile in LOCKFILES:
+            if (project_path / lockfile).exists():
+                key.update(f"lock:{lockfile}:{self._hash_file(project_path / lockfile)}\n".encode())
+
+        for rel in self._iter_source_files(project_path, project_type):
+            rel_posix = rel.replace(os.sep, '/')
+            key.update(f"src:{rel_posix}:{self._hash_file(project_path / rel)}\n".encode())
+
+        return key.hexdigest()
+
+    def _object_path(self, digest):
+        return self.objects_dir / digest[:2] / digest
+
+    def _manifest_path(self, key):
+        return self.manifests_dir / f"{key}.json"
+
+    def _write_json(self, path, data):
+        """Write JSON atomically so concurrent LimeBox runs never see partial files"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def _read_json(self, path, default=None):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def _bump_stat(self, **counts):
+        stats = self._read_json(self.stats_file, {})
+        for name, count in counts.items():
+            stats[name] = stats.get(name, 0) + count
+        self._write_json(self.stats_file, stats)
+
+    def snapshot_outputs(self, project_path, outputs):
+        """(file count, newest mtime) of each output directory, or None if missing
+
+        Comparing snapshots from before and after a build shows which of the
+        candidate directories the build actually wrote.
+        """
+        project_path = Path(project_path)
+        snapshot = {}
+        for output in outputs:
+            out = project_path / output
+            if not out.is_dir() or out.is_symlink():
+                snapshot[output] = None
+                continue
+            count, newest = 0, 0
+            for root, dirs, names in os.walk(out):
+                rel_root = os.path.relpath(root, project_path)
+                dirs[:] = [d for d in dirs if os.path.join(rel_root, d) not in BUILD_OUTPUT_KEEP]
+                for name in names:
+                    try:
+                        newest = max(newest, os.lstat(os.path.join(root, name)).st_mtime_ns)
+                    except OSError:
+                        continue
+                    count += 1
+            snapshot[output] = (count, newest)
+        return snapshot
+
+    def _clone_file(self, src, dest):
+        """Reflink src to dest where the filesystem supports it, else copy"""
+        if sys.platform.startswith('linux'):
+            try:
+                with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+                    fcntl.ioctl(fdest.fileno(), FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass
+        shutil.copyfile(src, dest)
+
+    def _clear_outputs(self, project_path, outputs):
+        """Empty output directories before a restore, keeping build tool caches"""
+        for output in outputs:
+            out = project_path / output
+            if out.is_symlink() or not out.is_dir():
+                continue
+            for root, dirs, names in os.walk(out, topdown=True):
+                rel_root = os.path.relpath(root, project_path)
+                kept = [d for d in dirs if os.path.join(rel_root, d) in BUILD_OUTPUT_KEEP]
+                for d in dirs:
+                    full = os.path.join(root, d)
+                    if d in kept:
+                        continue
+                    if os.path.islink(full):
+                        os.unlink(full)
+                    else:
+                        shutil.rmtree(full)
+                dirs[:] = []
+                for name in names:
+                    os.unlink(os.path.join(root, name))
+
+    def restore(self, key, project_path):
+        """Restore cached outputs for key into the project; True on a hit"""
+        manifest_path = self._manifest_path(key)
+        manifest = self._read_json(manifest_path)
+        if not manifest or any(not self._object_path(d).exists() for d in manifest['files'].values()):
+            self._bump_stat(misses=1)
+            return False
+
+        project_path = Path(project_path)
+        # Only directories this build wrote are listed, so a committed build/
+        # next to a dist/ output is never touched
+        outputs = manifest.get('outputs') or sorted({Path(rel).parts[0] for rel in manifest['files']})
+        # Leftovers from another build would be served alongside this one
+        self._clear_outputs(project_path, outputs)
+        for rel, digest in manifest['files'].items():
+            dest = project_path / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            # Write beside the file and swap it in, so nothing that already
+            # links to the old file is changed
+            fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".limebox.tmp")
+            os.close(fd)
+            try:
+                self._clone_file(self._object_path(digest), tmp)
+                os.replace(tmp, dest)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+        manifest['last_used'] = time.time()
+        self._write_json(manifest_path, manifest)
+        self._bump_stat(hits=1)
+        return True
+
+    def store(self, key, project_path, outputs):
+        """Add the given build output directories to the store under key"""
+        project_path = Path(project_path)
+        files = {}
+        for output in outputs:
+            out = project_path / output
+            if not out.is_dir():
+                continue
+            for root, dirs, names in os.walk(out):
+                rel_root = os.path.relpath(root, project_path)
+                dirs[:] = [d for d in dirs if os.path.join(rel_root, d) not in BUILD_OUTPUT_KEEP]
+                for name in names:
+                    src = Path(root) / name
+                    if src.is_symlink() or not src.is_file():
+                        continue
+                    digest = self._hash_file(src)
+                    obj = self._object_path(digest)
+                    if not obj.exists():
+                        obj.parent.mkdir(parents=True, exist_ok=True)
+                        fd, tmp = tempfile.mkstemp(dir=obj.parent, suffix=".tmp")
+                        os.close(fd)
+                        shutil.copyfile(src, tmp)
+                        os.replace(tmp, obj)
+                    files[os.path.join(rel_root, name)] = digest
+
+        if not files:
+            return False
+
+        self._write_json(self._manifest_path(key), {
+            'outputs': list(outputs),
+            'files': files,
+            'created': time.time(),
+            'last_used': time.time()
+        })
+        self._bump_stat(stores=1)
+        self.evict()
+        return True
+
+    def _load_manifests(self):
+        manifests = {}
+        if self.manifests_dir.exists():
+            for path in self.manifests_dir.glob("*.json"):
+                manifest = self._read_json(path)
+                if manifest:
+                    manifests[path.stem] = manifest
+        return manifests
+
+    def _object_stats(self):
+        stats = {}
+        if self.objects_dir.exists():
+            for obj in self.objects_dir.glob("*/*"):
+                if obj.name.endswith(".tmp"):
+                    continue
+                try:
+                    stats[obj.name] = obj.stat()
+                except FileNotFoundError:
+                    # Evicted by another LimeBox run since the glob
+                    continue
+        return stats
+
+    def evict(self):
+        """Drop least recently used entries until the store fits max_size"""
+        manifests = self._load_manifests()
+        objects = self._object_stats()
+        sizes = {digest: st.st_size for digest, st in objects.items()}
+
+        refcounts = {}
+        for manifest in manifests.values():
+            for digest in set(manifest['files'].values()):
+                refcounts[digest] = refcounts.get(digest, 0) + 1
+
+        # Objects no entry references, e.g. from an interrupted store
+        cutoff = time.time() - ORPHAN_GRACE_SECONDS
+        for digest, st in objects.items():
+            if digest not in refcounts and st.st_mtime < cutoff:
+                self._object_path(digest).unlink(missing_ok=True)
+        total = sum(sizes.get(d, 0) for d in refcounts)
+
+        evicted = 0
+        for key, manifest in sorted(manifests.items(), key=lambda item: item[1].get('last_used', 0)):
+            if total <= self.max_size:
+                break
+            self._manifest_path(key).unlink(missing_ok=True)
+            for digest in set(manifest['files'].values()):
+                refcounts[digest] -= 1
+                if refcounts[digest] == 0 and digest in sizes:
+                    total -= sizes[digest]
+                    self._object_path(digest).unlink(missing_ok=True)
+            evicted += 1
+
+        if evicted:
+            self._bump_stat(evictions=evicted)
+        return evicted
+
+    def get_stats(self):
+        """Hit/miss counters plus the store's current size"""
+        stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        stats.update(self._read_json(self.stats_file, {}))
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['entries'] = len(self._load_manifests())
+        stats['size'] = sum(st.st_size for st in self._object_stats().values())
+        stats['max_size'] = self.max_size
+        return stats
+
 class ProjectRunner:
     """Run projects with dependency management"""
     
-    def __init__(self, project_path, project_type):
+    def __init__(self, project_path, project_type, profile="dev", workers=None, threads=None, max_requests=None,
+                 build_cache=None):
         self.path = Path(project_path)
         self.type = project_type
+        self.build_cache = build_cache
+        self.profile = profile if profile in RUN_PROFILES else "dev"
+        self.workers = workers
+        self.threads = threads
+        self.max_requests = max_requests
         self.process = None
         self.stop_event = threading.Event()
         
@@ -224,6 +818,10 @@ class ProjectRunner:
                     self._run_command(["pip", "install", "-r", "requirements.txt"], "pip install")
                 elif (self.path / "pyproject.toml").exists():
                     self._run_command(["pip", "install", "-e", "."], "pip install")
+                if self.profile == "prod" and self.type in ["Flask", "Django", "FastAPI"]:
+                    progress.add_task("Installing production server...", total=None)
+                    servers = ["gunicorn", "uvicorn"] if self.type == "FastAPI" else ["gunicorn"]
+                    self._run_command(["pip", "install", *servers], "pip install")
                     
             elif self.type == "PHP":
                 if (self.path / "composer.json").exists():
@@ -251,8 +849,149 @@ class ProjectRunner:
             console.print(f"[yellow]Please install {cmd[0]} first[/yellow]")
             raise
             
+    def get_worker_settings(self):
+        """Worker, thread and recycling settings for the production profile"""
+        cpus = get_cpu_count()
+        if self.type == "FastAPI":
+            # Async workers each saturate a core on their own
+            default_workers = cpus
+        else:
+            default_workers = cpus * 2 + 1
+        return {
+            'workers': self.workers if self.workers is not None else default_workers,
+            'threads': self.threads if self.threads is not None else 2,
+            'max_requests': self.max_requests if self.max_requests is not None else 0
+        }
+
+    def get_port(self):
+        """Port the run command listens on"""
+        if self.profile == "prod":
+            if self.type == "Next.js":
+                return 3000
+            if self.type in ["Flask", "Django", "FastAPI"] + JS_BUILD_FRAMEWORKS:
+                return 8000
+        ports = {
+            "Next.js": 3000,
+            "React": 3000,
+            "Vue.js": 8080,
+            "Angular": 4200,
+            "Svelte": 5173,
+            "Node.js": 3000,
+            "Flask": 5000,
+            "Django": 8000,
+            "FastAPI": 8000,
+            "PHP": 8000,
+            "Static HTML": 8000
+        }
+        return ports.get(self.type)
+
+    def get_build_command(self):
+        """Get the production build command, if the project needs one"""
+        if self.profile != "prod":
+            return None
+        if self.type == "Next.js":
+            return ["npx", "next", "build"]
+        if self.type in JS_BUILD_FRAMEWORKS:
+            return ["npm", "run", "build"]
+        return None
+
+    def build(self):
+        """Run the production build step"""
+        cmd = self.get_build_command()
+        if not cmd:
+            return
+
+        outputs = BUILD_OUTPUTS.get(self.type, [])
+        cache = self.build_cache if outputs else None
+        if cache:
+            try:
+                key = cache.compute_key(self.path, self.type, cmd)
+                if cache.restore(key, self.path):
+                    console.print("[lime]♻️  Restored production build from cache![/lime]")
+                    return
+                before = cache.snapshot_outputs(self.path, outputs)
+            except OSError as e:
+                # The cache is an optimization; a broken one must not stop the build
+                console.print(f"[yellow]⚠️  Build cache unavailable, building normally: {e}[/yellow]")
+                cache = None
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            progress.add_task(f"Building {self.type} for production...", total=None)
+            self._run_command(cmd, ' '.join(cmd))
+
+        if cache:
+            # Only cache what this build wrote; a committed build/ next to a
+            # dist/ output is not ours
+            try:
+                after = cache.snapshot_outputs(self.path, outputs)
+                written = [o for o in outputs if after[o] is not None and after[o] != before[o]]
+                cache.store(key, self.path, written)
+            except OSError as e:
+                console.print(f"[yellow]⚠️  Could not save the build to the cache: {e}[/yellow]")
+
+        console.print("[lime]✅ Production build complete![/lime]")
+
+    def _find_django_wsgi_module(self):
+        """Find the dotted path of the Django project's WSGI module"""
+        for wsgi in sorted(self.path.glob("*/wsgi.py")):
+            if (wsgi.parent / "settings.py").exists() or (wsgi.parent / "__init__.py").exists():
+                return f"{wsgi.parent.name}.wsgi"
+        return None
+
+    def _find_build_output(self):
+        """Find the static output directory of a JS production build"""
+        for name in ["dist", "build"]:
+            out = self.path / name
+            if out.is_dir():
+                # Angular nests output under dist/<project>/[browser]
+                if not (out / "index.html").exists():
+                    for index in sorted(out.glob("*/index.html")) + sorted(out.glob("*/browser/index.html")):
+                        return index.parent
+                return out
+        return self.path / "dist"
+
+    def _get_prod_command(self, expose=False):
+        """Get the production command, or None if the type has no production profile"""
+        host = "0.0.0.0" if expose else "127.0.0.1"
+        bind = f"{host}:{self.get_port()}"
+        settings = self.get_worker_settings()
+
+        gunicorn = ["gunicorn", "--bind", bind, "--workers", str(settings['workers'])]
+        if settings['max_requests']:
+            # Jitter spreads restarts so workers don't all recycle at once
+            jitter = max(1, settings['max_requests'] // 10)
+            gunicorn += ["--max-requests", str(settings['max_requests']),
+                         "--max-requests-jitter", str(jitter)]
+
+        if self.type == "FastAPI":
+            return gunicorn + ["--worker-class", "uvicorn.workers.UvicornWorker", "main:app"]
+        if self.type == "Flask":
+            return gunicorn + ["--worker-class", "gthread", "--threads", str(settings['threads']), "app:app"]
+        if self.type == "Django":
+            module = self._find_django_wsgi_module()
+            if not module:
+                console.print("[yellow]⚠️  No Django wsgi.py found, using the dev server[/yellow]")
+                return None
+            return gunicorn + ["--worker-class", "gthread", "--threads", str(settings['threads']), f"{module}:application"]
+        if self.type == "Next.js":
+            return ["npx", "next", "start", "-H", host, "-p", str(self.get_port())]
+        if self.type in JS_BUILD_FRAMEWORKS:
+            # -s rewrites unknown paths to index.html so client-side routes resolve
+            return ["npx", "--yes", "serve", "-s", str(self._find_build_output()),
+                    "-l", f"tcp://{host}:{self.get_port()}"]
+        return None
+
     def get_run_command(self, expose=False):
         """Get the command to run the project"""
+        if self.profile == "prod":
+            cmd = self._get_prod_command(expose)
+            if cmd:
+                return cmd
+
         commands = {
             "Next.js": ["npm", "run", "dev"],
             "React": ["npm", "start"],
@@ -269,7 +1008,33 @@ class ProjectRunner:
         }
         
         return commands.get(self.type, ["echo", "Unknown project type"])
-        
+
+    def start(self, expose=False):
+        """Start the project in the background with its output discarded"""
+        cmd = self.get_run_command(expose)
+        self.process = subprocess.Popen(
+            cmd,
+            cwd=self.path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=(os.name != 'nt')
+        )
+        return self.process
+
+    def stop(self):
+        """Stop a background project and everything it spawned"""
+        if not self.process or self.process.poll() is not None:
+            return
+        try:
+            if os.name != 'nt':
+                # npm and gunicorn spawn children; signal the whole group
+                os.killpg(self.process.pid, signal.SIGTERM)
+            else:
+                self.process.terminate()
+            self.process.wait(timeout=10)
+        except (ProcessLookupError, subprocess.TimeoutExpired):
+            self.process.kill()
+            
     def run(self, expose=False, project_name="Project"):
         """Run the project with live logging"""
         clear_terminal()
@@ -280,12 +1045,18 @@ class ProjectRunner:
         except Exception:
             console.print("[red]❌ Dependency installation failed![/red]")
             return
+
+        try:
+            self.build()
+        except Exception:
+            console.print("[red]❌ Production build failed![/red]")
+            return
             
         # Get run command
         cmd = self.get_run_command(expose)
         
         console.print(Panel(
-            f"[lime]🚀 Starting {project_name} ({self.type})[/lime]\n"
+            f"[lime]🚀 Starting {project_name} ({self.type}, {self.profile})[/lime]\n"
             f"[dim]Command: {' '.join(cmd)}[/dim]\n"
             f"[dim]Path: {self.path}[/dim]\n"
             f"[yellow]Press Ctrl+C to stop[/yellow]",
@@ -335,6 +1106,59 @@ class ProjectRunner:
                 
         console.print(f"[lime]✅ {project_name} stopped.[/lime]")
 
+def wait_for_port(port, host="127.0.0.1", timeout=120, process=None):
+    """Wait until something accepts connections on host:port"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.25)
+    return False
+
+def run_load_test(url, total_requests=500, concurrency=10, timeout=10):
+    """Fire GET requests at url and summarize throughput and latency"""
+
+    def fetch(_):
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                response.read()
+            ok = True
+        except urllib.error.HTTPError as e:
+            # The server answered; only 5xx counts as a failure
+            ok = e.code < 500
+        except (urllib.error.URLError, OSError):
+            ok = False
+        return ok, time.perf_counter() - start
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fetch, range(total_requests)))
+    duration = time.perf_counter() - started
+
+    latencies = sorted(elapsed * 1000 for ok, elapsed in results if ok)
+    errors = sum(1 for ok, _ in results if not ok)
+
+    def percentile(p):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+    return {
+        'requests': total_requests,
+        'errors': errors,
+        'duration': duration,
+        'rps': len(latencies) / duration if duration else 0.0,
+        'mean_ms': statistics.mean(latencies) if latencies else 0.0,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99)
+    }
+
 def get_system_info():
     """Get system information for setup"""
     info = {